@@ -12,31 +12,104 @@ to the left of checkboxes, and JSON output explicitly storing percentage of each
 import os
 import sys
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, scrolledtext, filedialog, messagebox
-import xml.etree.ElementTree as ET
+from xml.parsers import expat
+import codecs
 import json
+import logging
+import textwrap
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _dump_json(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _dump_json_line(data):
+    """Serialize data to a single line of compact UTF-8 JSON, newline included"""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b"\n"
+
+def _load_json(raw):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Checklist criteria in the column order of the packed checklist matrix
+_CRITERIA = (
+    "single_sentence",
+    "multiple_sentences",
+    "low_quality_distractors",
+    "unsuitable_paragraph",
+    "unclear_answer",
+    "outside_knowledge"
+)
+
+# Display labels of the checklist criteria used in summaries and exports
+_CRITERIA_LABELS = {
+    "single_sentence": "Cần một câu",
+    "multiple_sentences": "Cần nhiều câu",
+    "low_quality_distractors": "Lựa chọn sai kém chất lượng",
+    "unsuitable_paragraph": "Đoạn văn không phù hợp",
+    "unclear_answer": "Đáp án không rõ ràng",
+    "outside_knowledge": "Cần kiến thức ngoài"
+}
+
+# Question fields kept in memory for every question; the rest is parsed on demand
+_INDEX_FIELDS = ("segment_id", "document_title", "segment_title", "question_id", "question_type")
+# Columns of the in-memory question index: the fields above plus the segment's byte span
+_SEGMENT_FIELDS = _INDEX_FIELDS + ("offset", "length", "position")
+
+# Number of fully parsed segments kept by the on-demand loader
+_SEGMENT_CACHE_SIZE = 16
+
+# Idle time (ms) after the last edit before pending changes are saved
+_SAVE_DELAY = 750
+
+# Number of diff log records after which the progress snapshot is rewritten
+_COMPACT_EVERY = 200
+
+# Most wrapped lines shown per choice; longer choices end in an ellipsis
+# and show their full text in a tooltip
+_CHOICE_MAX_LINES = 6
+
+# Text lines the choices tree shows at once; longer choice lists scroll
+_CHOICE_VISIBLE_LINES = 12
+
 class Tooltip:
     """Create a tooltip for a Tkinter widget"""
+    # One tooltip window shared by all instances; it is reconfigured and
+    # shown/hidden rather than created and destroyed on every hover
+    _shared_tw = None
+    _shared_label = None
+
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip_window = None
         self.widget.bind("<Enter>", self.show_tooltip)
         self.widget.bind("<Leave>", self.hide_tooltip)
 
-    def show_tooltip(self, event=None):
-        # Position tooltip to the left of the checkbox
-        tooltip_width = 200  # Estimated width based on wraplength
-        x = self.widget.winfo_rootx() - tooltip_width - 10  # 10px gap to the left
-        y = self.widget.winfo_rooty()  # Align top with checkbox
-        self.tooltip_window = tw = tk.Toplevel(self.widget)
+    @classmethod
+    def _create_window(cls, master):
+        cls._shared_tw = tw = tk.Toplevel(master)
         tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(
+        tw.withdraw()
+        cls._shared_label = tk.Label(
             tw,
-            text=self.text,
             background="#d9d9d9",  # Matches Tkinter default UI background
             foreground="#000000",  # Black text for contrast
             relief="solid",
@@ -45,12 +118,164 @@ class Tooltip:
             highlightbackground="#000000",  # Black border
             wraplength=200
         )
-        label.pack()
+        cls._shared_label.pack()
 
-    def hide_tooltip(self, event=None):
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+    @classmethod
+    def show_at(cls, widget, text, x, y):
+        """Show the shared tooltip window with text at screen position x, y"""
+        if cls._shared_tw is None:
+            cls._create_window(widget.winfo_toplevel())
+        cls._shared_label.configure(text=text)
+        cls._shared_tw.wm_geometry(f"+{x}+{y}")
+        cls._shared_tw.deiconify()
+
+    def show_tooltip(self, event=None):
+        # Position tooltip to the left of the checkbox
+        tooltip_width = 200  # Estimated width based on wraplength
+        x = self.widget.winfo_rootx() - tooltip_width - 10  # 10px gap to the left
+        y = self.widget.winfo_rooty()  # Align top with checkbox
+        Tooltip.show_at(self.widget, self.text, x, y)
+
+    @staticmethod
+    def hide_tooltip(event=None):
+        if Tooltip._shared_tw is not None:
+            Tooltip._shared_tw.withdraw()
+
+def _intern(value):
+    """sys.intern() that lets a missing (None) attribute through"""
+    return value if value is None else sys.intern(value)
+
+class SegmentIndexer:
+    """Stream XML with expat and report the questions of every Segment with its byte span"""
+    # This is the only place that decides which questions a Segment holds: the
+    # index is built with it, and get_question re-runs it with full=True on the
+    # bytes of one segment, so the stored positions always line up
+    def __init__(self, on_segment, full=False, encoding=None):
+        # on_segment(questions, offset, length) is called once per Segment; each
+        # question is an _INDEX_FIELDS tuple, or the complete record dict when
+        # full is set. The span covers the start tag up to (not including) the closing tag
+        self.on_segment = on_segment
+        self.full = full
+        # encoding overrides detection; fragments carry no XML declaration of their own
+        self.encoding = encoding
+        self.parser = expat.ParserCreate(encoding)
+        self.parser.buffer_text = True
+        self.parser.XmlDeclHandler = self._xml_decl
+        self.parser.StartDoctypeDeclHandler = self._doctype
+        self.parser.StartElementHandler = self._start
+        self.parser.EndElementHandler = self._end
+        self.parser.CharacterDataHandler = self._data
+        self._stack = []  # Tags open inside the current Segment
+        self._texts = []  # Text parts of each open element
+        self._collecting = False  # An element's text ends where its first child starts
+        self._offset = 0
+
+    def parse(self, file_path):
+        with open(file_path, 'rb') as f:
+            if f.read(2) in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+                self.full = True  # Slices of a UTF-16/32 file can't be decoded on their own
+            f.seek(0)
+            self.parser.ParseFile(f)
+
+    def parse_bytes(self, data):
+        self.parser.Parse(data, True)
+
+    # A segment's bytes are parsed on their own later, which needs an 8-bit
+    # compatible encoding and no DTD (its entities would be undefined there);
+    # otherwise switch to full mode and report complete records right away
+    def _xml_decl(self, version, encoding, standalone):
+        self.encoding = encoding
+        try:
+            if encoding and codecs.lookup(encoding).name.startswith(("utf-16", "utf-32")):
+                self.full = True
+        except LookupError:
+            pass
+
+    def _doctype(self, name, system_id, public_id, has_internal_subset):
+        self.full = True
+
+    def _start(self, tag, attrs):
+        stack = self._stack
+        depth = len(stack)
+        if not stack:
+            if tag != "Segment":
+                return
+            self._offset = self.parser.CurrentByteIndex
+            self._segment_id = attrs.get("id")
+            self._fields = {}
+            self._questions = None
+        elif depth == 1 and tag == "QA":
+            self._qa_questions = []
+        elif depth == 2 and tag == "Question" and stack[1] == "QA":
+            self._question_id = attrs.get("id")
+            self._question_fields = {}
+        elif self.full and depth == 3 and tag == "Choices" and stack[1:] == ["QA", "Question"]:
+            self._choices = []
+        elif self.full and depth == 4 and tag == "Choice" and stack[1:] == ["QA", "Question", "Choices"]:
+            self._choice_id = attrs.get("id")
+        stack.append(tag)
+        self._texts.append([])
+        self._collecting = True
+
+    def _data(self, text):
+        if self._collecting:
+            self._texts[-1].append(text)
+
+    def _end(self, tag):
+        stack = self._stack
+        if not stack:
+            return
+        stack.pop()
+        text = "".join(self._texts.pop())
+        self._collecting = False
+        depth = len(stack)
+        # The last child with a tag wins, and only questions with text and a
+        # Choices element are kept
+        if depth == 0:
+            self._emit()
+        elif depth == 1:
+            if tag == "QA":
+                self._questions = self._qa_questions
+            else:
+                self._fields[tag] = text
+        elif depth == 2:
+            if tag == "Question" and stack[1] == "QA":
+                fields = self._question_fields
+                if fields.get("QuestionText") and "Choices" in fields:
+                    self._qa_questions.append((self._question_id, fields))
+        elif depth == 3 and stack[1:] == ["QA", "Question"]:
+            self._question_fields[tag] = self._choices if self.full and tag == "Choices" else text
+        elif self.full and depth == 4 and tag == "Choice" and stack[1:] == ["QA", "Question", "Choices"]:
+            if text:
+                self._choices.append({"id": self._choice_id, "text": text})
+
+    def _emit(self):
+        fields = self._fields
+        questions = []
+        if fields.get("SegmentText") and self._questions is not None:
+            document_title = fields.get("DocumentTitle") or "Unknown"
+            segment_title = fields.get("SegmentTitle") or ""
+            # Ids key the checklist rows and comments, and question types repeat
+            # across the whole file, so keep one shared copy of each
+            segment_id = _intern(self._segment_id)
+            for question_id, question_fields in self._questions:
+                question_id = _intern(question_id)
+                question_type = sys.intern(question_fields.get("QuestionType") or "")
+                if not self.full:
+                    questions.append((segment_id, document_title, segment_title, question_id, question_type))
+                    continue
+                questions.append({
+                    "segment_id": segment_id,
+                    "document_title": document_title,
+                    "segment_title": segment_title,
+                    "segment_text": fields["SegmentText"],
+                    "question_id": question_id,
+                    "question_type": question_type,
+                    "question_text": question_fields["QuestionText"],
+                    "choices": question_fields["Choices"],
+                    "correct_choice": question_fields.get("CorrectChoice") or ""
+                })
+        self.on_segment(questions, self._offset, self.parser.CurrentByteIndex - self._offset)
 
 class CompactXMLValidator:
     def __init__(self, root, xml_file=None):
@@ -59,11 +284,49 @@ class CompactXMLValidator:
         self.root.geometry("1000x700")
         
         # Application state
-        self.segments = []
+        self._set_index(tuple([] for _ in _SEGMENT_FIELDS))  # One list per _SEGMENT_FIELDS entry
         self.current_index = 0
-        self.checklist = {}  # Stores checklist states {question_id: {criterion: bool}}
+        self._segment_cache = OrderedDict()  # Segment offset -> parsed question records
+        self._all_segments = None  # Every segment's records, for files parsed eagerly
+        self._xml_encoding = None  # Declared encoding, reused for segment fragments
+        self._last_segment_text = None  # Text currently shown in segment_text
+        self._parse_future = None  # Result of the most recent background XML parse
         self.comments = {}
         
+        # Checklist states packed one byte per criterion, one row per question id
+        self._qid_to_row = {}
+        self._check_matrix = bytearray()
+        self._stored_rows = set()  # Rows that appear in the saved checklist
+        self._extra_checklist = {}  # Saved states for question ids not in the loaded file
+        
+        # Incrementally maintained checklist stats
+        self._qid_set = frozenset()
+        self._counts = {}
+        self._checked_qids = set()
+        
+        # Pending debounced save and whether the comment box has unsaved edits
+        self._save_after_id = None
+        self._comment_dirty = False
+        
+        # Idle callback that saves the checklist once after its variables change,
+        # and a flag that stops load_question's own updates from counting as edits
+        self._checklist_after_id = None
+        self._loading_checklist = False
+        
+        # Single pending timer driving the save indicator and the save it reports on
+        self._indicator_after_id = None
+        self._indicator_text = ""
+        self._watched_save = None
+        
+        # Single worker that writes progress files off the Tk main thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._last_write = None
+        
+        # Append-only log of changes made since the last progress snapshot
+        self._diff_log = None
+        self._log_records = 0
+        self._dirty_qids = set()  # Questions edited since the last flush to the log
+        
         # Create main UI
         self.create_ui()
         
@@ -133,15 +396,49 @@ class CompactXMLValidator:
         question_frame = ttk.LabelFrame(left_frame, text="Question")
         question_frame.pack(fill=tk.X, pady=5)
         
-        self.question_text = scrolledtext.ScrolledText(question_frame, wrap=tk.WORD, height=4, font=("TkDefaultFont", 12))
-        self.question_text.pack(fill=tk.X, padx=10, pady=10)
+        # Bold font for the question type
+        self._bold_font = tkfont.Font(family="TkDefaultFont", size=12, weight="bold")
+        
+        # The question is short and read-only, so labels replace a Text widget
+        self.question_type_label = ttk.Label(question_frame, font=self._bold_font)
+        self.question_type_label.pack(anchor="w", padx=10, pady=(10, 0))
+        self.question_label = ttk.Label(question_frame, font=("TkDefaultFont", 12), justify=tk.LEFT)
+        self.question_label.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.question_label.bind("<Configure>", self._wrap_question)
+        self._question_wrap = None  # Current wraplength of question_label
         
         # Choices
         choices_frame = ttk.LabelFrame(left_frame, text="Choices")
         choices_frame.pack(fill=tk.X, pady=5)
         
-        self.choices_container = ttk.Frame(choices_frame)
-        self.choices_container.pack(fill=tk.X, padx=5, pady=5)
+        # All choices live in one Treeview; the row height follows the longest wrapped
+        # choice, and the tree only lays out the rows inside its viewport
+        self._choice_font = tkfont.nametofont("TkDefaultFont")
+        self._choice_style = ttk.Style(self.root)
+        self._choice_lines = 1  # Wrapped lines per row currently configured
+        self._choice_style.configure("Choices.Treeview", rowheight=self._choice_row_height(1))
+        self.choices_tree = ttk.Treeview(choices_frame, columns=("mark",), show="tree", height=1,
+                                         selectmode="none", style="Choices.Treeview")
+        self.choices_tree.column("#0", stretch=True)
+        self.choices_tree.column("mark", width=30, stretch=False, anchor="center")
+        self.choices_tree.tag_configure("correct", foreground="red")
+        choices_scroll = ttk.Scrollbar(choices_frame, orient=tk.VERTICAL, command=self.choices_tree.yview)
+        self.choices_tree.configure(yscrollcommand=choices_scroll.set)
+        choices_scroll.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 5), pady=5)
+        self.choices_tree.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0), pady=5)
+        self.choices_tree.bind("<Configure>", self._rewrap_choices)
+        self.choices_tree.bind("<Motion>", self._on_choice_motion)
+        self.choices_tree.bind("<Leave>", self._hide_choice_tip)
+        self._choice_items = []  # (item id, unwrapped text) of the shown choices
+        self._clipped_choices = {}  # Item id -> full text of choices cut off by the ellipsis
+        self._choice_tip_item = None  # Row whose full text the tooltip shows
+        # Choice text is wrapped to a character count derived from the column width
+        self._char_width = max(1, self._choice_font.measure("0"))
+        self._wrap_chars = max(10, self.choices_tree.column("#0", "width") // self._char_width)
+        # Width inside the tree not available to choice text: the mark column, the
+        # per-item indent that show="tree" keeps in #0, and a little padding
+        indent = self._choice_style.lookup("Choices.Treeview", "indent")
+        self._choice_reserved = self.choices_tree.column("mark", "width") + int(indent or 20) + 8
         
         # Right side - validation
         right_frame = ttk.Frame(content_frame)
@@ -152,14 +449,9 @@ class CompactXMLValidator:
         checklist_frame.pack(fill=tk.X, pady=5)
         
         # Checklist variables
-        self.checklist_vars = {
-            "single_sentence": tk.BooleanVar(value=False),
-            "multiple_sentences": tk.BooleanVar(value=False),
-            "low_quality_distractors": tk.BooleanVar(value=False),
-            "unsuitable_paragraph": tk.BooleanVar(value=False),
-            "unclear_answer": tk.BooleanVar(value=False),
-            "outside_knowledge": tk.BooleanVar(value=False)
-        }
+        self.checklist_vars = {key: tk.BooleanVar(value=False) for key in _CRITERIA}
+        for var in self.checklist_vars.values():
+            var.trace_add("write", self._on_checklist_write)
         
         # Checklist checkboxes with tooltips
         checklist_items = [
@@ -174,7 +466,7 @@ class CompactXMLValidator:
         for label, var_key, tooltip in checklist_items:
             cb_frame = ttk.Frame(checklist_frame)
             cb_frame.pack(fill=tk.X, pady=2)
-            cb = ttk.Checkbutton(cb_frame, text=label, variable=self.checklist_vars[var_key], command=self.save_current_checklist)
+            cb = ttk.Checkbutton(cb_frame, text=label, variable=self.checklist_vars[var_key])
             cb.pack(side=tk.LEFT)
             Tooltip(cb, tooltip)
         
@@ -185,8 +477,8 @@ class CompactXMLValidator:
         self.comments_text = scrolledtext.ScrolledText(comments_frame, wrap=tk.WORD)
         self.comments_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Bind event to save comment
-        self.comments_text.bind("<KeyRelease>", self.save_current_comment)
+        # Save comment only when the buffer actually changes
+        self.comments_text.bind("<<Modified>>", self._on_comment_modified)
         
         # Status bar
         status_frame = ttk.Frame(main_frame)
@@ -198,6 +490,68 @@ class CompactXMLValidator:
         self.save_indicator = ttk.Label(status_frame, text="")
         self.save_indicator.pack(side=tk.RIGHT)
     
+    def _wrap_question(self, event):
+        # <Configure> also fires on height changes, which don't affect wrapping
+        if event.width != self._question_wrap:
+            self._question_wrap = event.width
+            self.question_label.configure(wraplength=event.width)
+    
+    def _wrap_choice(self, text):
+        """Break choice text into lines that fit the text column; returns (lines, clipped)
+        
+        Past _CHOICE_MAX_LINES the last line is shortened with an ellipsis.
+        """
+        lines = textwrap.wrap(text, self._wrap_chars) or [""]
+        if len(lines) <= _CHOICE_MAX_LINES:
+            return lines, False
+        rest = " ".join(lines[_CHOICE_MAX_LINES - 1:])
+        lines = lines[:_CHOICE_MAX_LINES - 1]
+        lines.append(textwrap.shorten(rest, self._wrap_chars, placeholder=" …"))
+        return lines, True
+    
+    def _choice_row_height(self, lines):
+        return self._choice_font.metrics("linespace") * lines + 4
+    
+    def _render_choices(self):
+        """Wrap the shown choices and size the rows and the tree to fit them"""
+        self._clipped_choices = {}
+        most_lines = 1
+        for item, text in self._choice_items:
+            lines, clipped = self._wrap_choice(text)
+            if clipped:
+                self._clipped_choices[item] = text
+            most_lines = max(most_lines, len(lines))
+            self.choices_tree.item(item, text="\n".join(lines))
+        if most_lines != self._choice_lines:
+            self._choice_lines = most_lines
+            self._choice_style.configure("Choices.Treeview", rowheight=self._choice_row_height(most_lines))
+        rows = min(len(self._choice_items), _CHOICE_VISIBLE_LINES // most_lines)
+        self.choices_tree.configure(height=max(1, rows))
+    
+    def _on_choice_motion(self, event):
+        item = self.choices_tree.identify_row(event.y)
+        if item == self._choice_tip_item:
+            return
+        self._choice_tip_item = item
+        if item in self._clipped_choices:
+            Tooltip.show_at(self.choices_tree, self._clipped_choices[item], event.x_root + 15, event.y_root + 10)
+        else:
+            Tooltip.hide_tooltip()
+    
+    def _hide_choice_tip(self, event=None):
+        self._choice_tip_item = None
+        Tooltip.hide_tooltip()
+    
+    def _rewrap_choices(self, event):
+        # ttk only stretches #0 in its idle layout pass, so column("#0", "width")
+        # can still be stale here; derive the text width from the tree's own size.
+        # Only a change in how many characters fit on a line needs a rewrap
+        chars = max(10, (event.width - self._choice_reserved) // self._char_width)
+        if chars == self._wrap_chars:
+            return
+        self._wrap_chars = chars
+        self._render_choices()
+    
     def open_file(self):
         file_path = filedialog.askopenfilename(
             title="Open XML File",
@@ -207,68 +561,98 @@ class CompactXMLValidator:
             self.load_xml(file_path)
     
     def load_xml(self, file_path):
+        """Index file_path on a worker thread; the result is installed on the Tk thread"""
+        self.status_label.config(text=f"Loading {os.path.basename(file_path)}...")
+        self.prev_btn.config(state=tk.DISABLED)
+        self.next_btn.config(state=tk.DISABLED)
+        self._parse_future = future = Future()
+        threading.Thread(target=self._parse_worker, args=(file_path, future), daemon=True).start()
+        self.root.after(50, self._poll_parse, future, file_path)
+    
+    def _parse_worker(self, file_path, future):
+        # Runs off the Tk thread, so it must not touch any widget
+        try:
+            future.set_result(self.index_xml(file_path))
+        except Exception as e:
+            future.set_exception(e)
+    
+    def _poll_parse(self, future, file_path):
+        if future is not self._parse_future:
+            return  # Superseded by a file opened later
+        if not future.done():
+            self.root.after(50, self._poll_parse, future, file_path)
+            return
+        self._on_parsed(future, file_path)
+    
+    def index_xml(self, file_path):
+        """Index file_path; returns (columns, encoding, records)
+        
+        columns holds one list per _SEGMENT_FIELDS entry and encoding is the
+        declared file encoding. records maps segment offsets to their parsed
+        questions when the segments can't be re-read on their own, else None.
+        """
+        rows = []
+        records = {}
+        
+        # Keep only the index fields and the segment's byte span; the
+        # texts and choices are re-read from the file when displayed
+        def add_segment(entries, offset, length):
+            if indexer.full:
+                records[offset] = entries
+                entries = [tuple(entry[field] for field in _INDEX_FIELDS) for entry in entries]
+            for position, entry in enumerate(entries):
+                rows.append(entry + (offset, length, position))
+        
+        indexer = SegmentIndexer(add_segment)
+        indexer.parse(file_path)
+        columns = tuple(map(list, zip(*rows))) if rows else tuple([] for _ in _SEGMENT_FIELDS)
+        return columns, indexer.encoding, records if indexer.full else None
+    
+    def _set_index(self, columns):
+        """Install the column lists of a question index"""
+        (self._seg_ids, self._doc_titles, self._seg_titles, self._q_ids, self._q_types,
+         self._offsets, self._lengths, self._positions) = columns
+    
+    def _on_parsed(self, future, file_path):
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            columns, encoding, all_segments = future.result()
             
-            self.xml_file_path = file_path
-            self.segments = []
+            # Pending edits belong to the file that is still open: first a checklist
+            # write waiting in after_idle, then the debounced save
+            if self._checklist_after_id is not None:
+                self.root.after_cancel(self._checklist_after_id)
+                self._apply_checklist_write()
+            self._close_progress()
+            self.current_index = 0
             
-            for segment in root.findall("Segment"):
-                segment_id = segment.get("id")
-                segment_text = segment.find("SegmentText")
-                if segment_text is None or not segment_text.text:
-                    continue
-                
-                doc_title = segment.find("DocumentTitle")
-                doc_title_text = doc_title.text if doc_title is not None else "Unknown"
-                
-                segment_title = segment.find("SegmentTitle")
-                segment_title_text = segment_title.text if segment_title is not None else ""
-                
-                qa_elem = segment.find("QA")
-                if qa_elem is None:
-                    continue
-                
-                for question_elem in qa_elem.findall("Question"):
-                    question_id = question_elem.get("id")
-                    question_type_elem = question_elem.find("QuestionType")
-                    question_type = question_type_elem.text if question_type_elem is not None else ""
-                    question_text_elem = question_elem.find("QuestionText")
-                    if question_text_elem is None or not question_text_elem.text:
-                        continue
-                    
-                    choices_elem = question_elem.find("Choices")
-                    if choices_elem is None:
-                        continue
-                    
-                    choices = []
-                    for choice_elem in choices_elem.findall("Choice"):
-                        choice_id = choice_elem.get("id")
-                        if choice_elem.text:
-                            choices.append({"id": choice_id, "text": choice_elem.text})
-                    
-                    correct_choice_elem = question_elem.find("CorrectChoice")
-                    correct_choice = correct_choice_elem.text if correct_choice_elem is not None else ""
-                    
-                    self.segments.append({
-                        "segment_id": segment_id,
-                        "document_title": doc_title_text,
-                        "segment_title": segment_title_text,
-                        "segment_text": segment_text.text,
-                        "question_id": question_id,
-                        "question_type": question_type,
-                        "question_text": question_text_elem.text,
-                        "choices": choices,
-                        "correct_choice": correct_choice
-                    })
+            self.xml_file_path = file_path
+            # Names derived from the path, used on every save and status update
+            self._xml_basename = os.path.basename(file_path)
+            base_name = os.path.splitext(file_path)[0]
+            self._progress_file = f"{base_name}_progress.json"
+            self._log_file = f"{base_name}_progress.jsonl"
+            self._set_index(columns)
+            self._segment_cache = OrderedDict()
+            self._all_segments = all_segments
+            self._xml_encoding = encoding
+            self._qid_set = frozenset(self._q_ids)
+            self._qid_to_row = {}
+            for qid in self._q_ids:
+                self._qid_to_row.setdefault(qid, len(self._qid_to_row))
+            self._check_matrix = bytearray(len(self._qid_to_row) * len(_CRITERIA))
+            self._stored_rows = set()
+            self._extra_checklist = {}
+            self.comments = {}
+            self._dirty_qids = set()
+            self.rebuild_stats()
             
-            if self.segments:
-                print(f"Successfully loaded {len(self.segments)} questions")
-                self.status_label.config(text=f"Loaded {len(self.segments)} questions from {os.path.basename(file_path)}")
+            if self._q_ids:
+                logger.info("Successfully loaded %d questions", len(self._q_ids))
+                self.status_label.config(text=f"Loaded {len(self._q_ids)} questions from {self._xml_basename}")
                 self.try_load_progress()
+                self._open_diff_log()
                 self.update_progress_bar()
-                self.root.title(f"Question Validator - {os.path.basename(file_path)}")
+                self.root.title(f"Question Validator - {self._xml_basename}")
             else:
                 messagebox.showwarning("No Data", "No valid questions found in the XML file.")
                 self.status_label.config(text="No valid questions found in the XML file")
@@ -278,156 +662,349 @@ class CompactXMLValidator:
             traceback.print_exc()
             messagebox.showerror("Error", f"Failed to load XML file: {str(e)}")
             self.status_label.config(text=f"Error: {str(e)}")
+            self.update_nav_buttons()
+    
+    def get_question(self, index):
+        """Return the full question record at index, parsing its segment on demand"""
+        offset = self._offsets[index]
+        if self._all_segments is not None:
+            records = self._all_segments[offset]
+        elif offset in self._segment_cache:
+            records = self._segment_cache[offset]
+            self._segment_cache.move_to_end(offset)
+        else:
+            with open(self.xml_file_path, 'rb') as f:
+                f.seek(offset)
+                raw = f.read(self._lengths[index])
+            records = []
+            indexer = SegmentIndexer(lambda questions, *span: records.extend(questions),
+                                     full=True, encoding=self._xml_encoding)
+            indexer.parse_bytes(raw + b"</Segment>")
+            self._segment_cache[offset] = records
+            if len(self._segment_cache) > _SEGMENT_CACHE_SIZE:
+                self._segment_cache.popitem(last=False)
+        position = self._positions[index]
+        question_id = self._q_ids[index]
+        if position >= len(records) or records[position]["question_id"] != question_id:
+            # The index no longer matches the file (e.g. it changed on disk);
+            # showing the record at this position would mix up two questions
+            raise ValueError(f"Question {question_id} was not found where the index expects it. "
+                             "Reopen the XML file.")
+        return records[position]
     
     def load_question(self, index):
-        if not self.segments or index < 0 or index >= len(self.segments):
+        if not self._q_ids or index < 0 or index >= len(self._q_ids):
             return
         
-        self.auto_save_progress()
-        data = self.segments[index]
+        if self._checklist_after_id is not None:
+            self.root.after_cancel(self._checklist_after_id)
+            self._apply_checklist_write()
+        self._flush_save()
+        try:
+            data = self.get_question(index)
+        except (OSError, ValueError, expat.ExpatError) as e:
+            messagebox.showerror("Error", str(e))
+            return
         self.current_index = index
+        self._log_change({"index": index})
         
-        self.segment_text.config(state=tk.NORMAL)
-        self.segment_text.delete(1.0, tk.END)
-        self.segment_text.insert(tk.END, data["segment_text"])
-        self.segment_text.config(state=tk.DISABLED)
-        
-        self.question_text.config(state=tk.NORMAL)
-        self.question_text.delete(1.0, tk.END)
-        question_header = f"({data['question_type']}) "
-        self.question_text.insert(tk.END, question_header, "bold")
-        self.question_text.insert(tk.END, data["question_text"])
-        self.question_text.tag_configure("bold", font=("TkDefaultFont", 12, "bold"))
-        self.question_text.config(state=tk.DISABLED)
+        # Questions of the same segment share its text; only refill it when it changes
+        if data["segment_text"] != self._last_segment_text:
+            self.segment_text.config(state=tk.NORMAL)
+            self.segment_text.delete(1.0, tk.END)
+            self.segment_text.insert(tk.END, data["segment_text"])
+            self.segment_text.config(state=tk.DISABLED)
+            self._last_segment_text = data["segment_text"]
         
-        for widget in self.choices_container.winfo_children():
-            widget.destroy()
+        self.question_type_label.configure(text=f"({data['question_type']})")
+        self.question_label.configure(text=data["question_text"])
         
+        # Reuse the rows already in the tree; only the surplus is inserted or deleted
+        rows = self.choices_tree.get_children()
+        self._choice_items = []
         for i, choice in enumerate(data["choices"]):
             is_correct = choice["id"] == data["correct_choice"]
-            choice_frame = ttk.Frame(self.choices_container)
-            choice_frame.pack(fill=tk.X, pady=2)
-            
-            if is_correct:
-                choice_label = tk.Label(
-                    choice_frame, 
-                    text=choice['text'], 
-                    anchor="w",
-                    wraplength=350,
-                    justify=tk.LEFT
-                )
-                choice_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-                check_label = tk.Label(
-                    choice_frame, 
-                    text="✓", 
-                    fg="red",
-                    font=("TkDefaultFont", 12, "bold")
-                )
-                check_label.pack(side=tk.RIGHT, padx=5)
+            row = dict(
+                values=("✓" if is_correct else "",),
+                tags=("correct",) if is_correct else ()
+            )
+            if i < len(rows):
+                item = rows[i]
+                self.choices_tree.item(item, **row)
             else:
-                choice_label = tk.Label(
-                    choice_frame, 
-                    text=choice['text'], 
-                    anchor="w",
-                    wraplength=350,
-                    justify=tk.LEFT
-                )
-                choice_label.pack(fill=tk.X, padx=5)
-        
-        self.position_label.config(text=f"Question {index + 1} of {len(self.segments)}")
-        self.prev_btn.config(state=tk.NORMAL if index > 0 else tk.DISABLED)
-        self.next_btn.config(state=tk.NORMAL if index < len(self.segments) - 1 else tk.DISABLED)
-        
-        question_id = data["question_id"]
-        checklist_state = self.checklist.get(question_id, {
-            "single_sentence": False,
-            "multiple_sentences": False,
-            "low_quality_distractors": False,
-            "unsuitable_paragraph": False,
-            "unclear_answer": False,
-            "outside_knowledge": False
-        })
-        for key, var in self.checklist_vars.items():
-            var.set(checklist_state[key])
+                item = self.choices_tree.insert("", "end", **row)
+            self._choice_items.append((item, choice['text']))
+        if len(rows) > len(data["choices"]):
+            self.choices_tree.delete(*rows[len(data["choices"]):])
+        self._render_choices()
+        self._hide_choice_tip()
+        self.choices_tree.yview_moveto(0)
+        
+        self.position_label.config(text=f"Question {index + 1} of {len(self._q_ids)}")
+        self.update_nav_buttons()
+        
+        question_id = self._q_ids[index]
+        self._loading_checklist = True
+        try:
+            for key, flag in zip(_CRITERIA, self.get_flags(question_id)):
+                var = self.checklist_vars[key]
+                if var.get() != bool(flag):
+                    var.set(bool(flag))
+        finally:
+            self._loading_checklist = False
         
         self.comments_text.delete(1.0, tk.END)
         if question_id in self.comments:
             self.comments_text.insert(tk.END, self.comments[question_id])
+        # Loading a comment is not an edit
+        self.comments_text.edit_modified(False)
         
         self.update_progress_bar()
     
+    def update_nav_buttons(self):
+        index = self.current_index
+        self.prev_btn.config(state=tk.NORMAL if self._q_ids and index > 0 else tk.DISABLED)
+        self.next_btn.config(state=tk.NORMAL if index < len(self._q_ids) - 1 else tk.DISABLED)
+    
     def prev_question(self):
         if self.current_index > 0:
             self.load_question(self.current_index - 1)
     
     def next_question(self):
-        if self.current_index < len(self.segments) - 1:
+        if self.current_index < len(self._q_ids) - 1:
             self.load_question(self.current_index + 1)
     
+    def _on_checklist_write(self, *args):
+        # Several variables changing together produce a single save
+        if self._loading_checklist or self._checklist_after_id is not None:
+            return
+        self._checklist_after_id = self.root.after_idle(self._apply_checklist_write)
+    
+    def _apply_checklist_write(self):
+        self._checklist_after_id = None
+        self.save_current_checklist()
+    
     def save_current_checklist(self):
-        if not self.segments:
+        if not self._q_ids:
             return
             
-        question_id = self.segments[self.current_index]["question_id"]
-        checklist_state = {key: var.get() for key, var in self.checklist_vars.items()}
-        self.checklist[question_id] = checklist_state
+        question_id = self._q_ids[self.current_index]
+        flags = bytes(self.checklist_vars[key].get() for key in _CRITERIA)
+        previous_flags = self.get_flags(question_id)
+        self.set_flags(question_id, flags)
+        self.update_stats(question_id, previous_flags, flags)
+        self._dirty_qids.add(question_id)
         self.update_progress_bar()
-        self.show_save_indicator()
+        self._schedule_save()
     
     def save_current_comment(self, event=None):
-        if not self.segments:
+        if not self._q_ids:
             return
-            
-        question_id = self.segments[self.current_index]["question_id"]
-        comment = self.comments_text.get(1.0, tk.END).strip()
-        self.comments[question_id] = comment
+        
+        # The comment text is read once when the debounced save fires
+        self._comment_dirty = True
+        self._schedule_save()
+    
+    def _on_comment_modified(self, event=None):
+        if not self.comments_text.edit_modified():
+            return
+        self.comments_text.edit_modified(False)
+        self.save_current_comment()
+    
+    def _sync_comment(self):
+        """Copy the comment box into self.comments if it has unsaved edits"""
+        if not self._comment_dirty or not self._q_ids:
+            return
+        question_id = self._q_ids[self.current_index]
+        self.comments[question_id] = self.comments_text.get(1.0, tk.END).strip()
+        self._comment_dirty = False
+        self._dirty_qids.add(question_id)
+    
+    def _schedule_save(self):
+        """Coalesce rapid edits into a single save once the user pauses"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(_SAVE_DELAY, self._flush_save)
         self.show_save_indicator()
     
+    def _flush_save(self):
+        """Run any pending debounced save immediately"""
+        pending = self._save_after_id is not None
+        if pending:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._sync_comment()
+        self._log_dirty()
+        future = self.auto_save_progress()
+        if pending and future is not None:
+            self._watch_save(future)
+    
+    def get_flags(self, question_id):
+        """Return the checklist row of a question as bytes in _CRITERIA order"""
+        width = len(_CRITERIA)
+        start = self._qid_to_row[question_id] * width
+        return bytes(self._check_matrix[start:start + width])
+    
+    def set_flags(self, question_id, flags):
+        row = self._qid_to_row[question_id]
+        width = len(_CRITERIA)
+        self._check_matrix[row * width:(row + 1) * width] = flags
+        self._stored_rows.add(row)
+    
+    def get_checklist(self, question_id):
+        """Return the checklist of a question as a {criterion: bool} dict"""
+        return {key: bool(flag) for key, flag in zip(_CRITERIA, self.get_flags(question_id))}
+    
+    def checklist_snapshot(self):
+        """Build the {question_id: {criterion: bool}} mapping stored in progress files"""
+        checklist = dict(self._extra_checklist)
+        for qid, row in self._qid_to_row.items():
+            if row in self._stored_rows:
+                checklist[qid] = self.get_checklist(qid)
+        return checklist
+    
+    def restore_checklist(self, checklist):
+        """Load a saved {question_id: {criterion: bool}} mapping into the matrix"""
+        self._check_matrix = bytearray(len(self._check_matrix))
+        self._stored_rows = set()
+        self._extra_checklist = {}
+        for qid, state in checklist.items():
+            if qid in self._qid_to_row:
+                self.set_flags(qid, bytes(bool(state.get(key, False)) for key in _CRITERIA))
+            else:
+                self._extra_checklist[qid] = state
+        self.rebuild_stats()
+    
+    def rebuild_stats(self):
+        """Recompute the per-criterion counts and checked set from the checklist matrix"""
+        width = len(_CRITERIA)
+        self._counts = {key: sum(self._check_matrix[i::width]) for i, key in enumerate(_CRITERIA)}
+        self._checked_qids = {qid for qid in self._qid_to_row if any(self.get_flags(qid))}
+    
+    def update_stats(self, question_id, previous_flags, flags):
+        """Apply the difference between two checklist rows of one question"""
+        for key, old, new in zip(_CRITERIA, previous_flags, flags):
+            self._counts[key] += new - old
+        if any(flags):
+            self._checked_qids.add(question_id)
+        else:
+            self._checked_qids.discard(question_id)
+    
     def update_progress_bar(self):
-        if not self.segments:
+        if not self._q_ids:
             self.progress_bar["value"] = 0
             return
         
-        # Count questions with at least one checklist item checked
-        checked_count = sum(1 for qid in [s["question_id"] for s in self.segments] 
-                          if qid in self.checklist and any(self.checklist[qid].values()))
-        progress_value = (checked_count / len(self.segments)) * 100
+        # Questions with at least one checklist item checked
+        progress_value = (len(self._checked_qids) / len(self._q_ids)) * 100
         self.progress_bar["value"] = progress_value
     
-    def auto_save_progress(self):
-        if not hasattr(self, 'xml_file_path') or not self.segments:
+    def auto_save_progress(self, background=True):
+        if not hasattr(self, 'xml_file_path') or not self._q_ids:
+            return
+        # Changes are already in the diff log; only compact it once it grows
+        if background and self._diff_log is not None and self._log_records < _COMPACT_EVERY:
+            return self._last_write
+        return self.save_progress(silent=True, background=background)
+    
+    def _open_diff_log(self):
+        try:
+            self._diff_log = open(self._log_file, 'ab')
+        except OSError as e:
+            # A read-only folder must not stop the review; saves fall back to full snapshots
+            logger.warning("Cannot open progress log %s: %s", self._log_file, e)
+            self._diff_log = None
+            return
+        self._log_records = 0
+        # try_load_progress already replayed a leftover log; fold it into the snapshot
+        if self._diff_log.tell() > 0:
+            self.save_progress(silent=True)
+    
+    def _close_progress(self):
+        """Write a final snapshot of the open file and retire its diff log"""
+        self._flush_save()
+        # Let queued background writes land before the final synchronous snapshot
+        self._io_pool.submit(lambda: None).result()
+        saved = self.auto_save_progress(background=False)
+        if self._diff_log is not None:
+            self._diff_log.close()
+            if saved:
+                # Everything is in the snapshot; don't leave an empty log behind
+                os.remove(self._diff_log.name)
+            self._diff_log = None
+    
+    def _log_change(self, record):
+        """Queue one change record for the diff log"""
+        if self._diff_log is None:
+            return
+        record["t"] = datetime.now().isoformat()
+        self._log_records += 1
+        self._last_write = self._io_pool.submit(self._append_log, self._diff_log, _dump_json_line(record))
+    
+    def _log_dirty(self):
+        """Append the current state of every edited question to the diff log"""
+        if not self._dirty_qids:
+            return
+        now = datetime.now().isoformat()
+        lines = []
+        for qid in self._dirty_qids:
+            record = {"qid": qid}
+            if self._qid_to_row[qid] in self._stored_rows:
+                record["check"] = list(self.get_flags(qid))
+            if qid in self.comments:
+                record["comment"] = self.comments[qid]
+            record["t"] = now
+            lines.append(_dump_json_line(record))
+        self._dirty_qids = set()
+        if self._diff_log is None:
             return
-        self.save_progress(silent=True)
+        self._log_records += len(lines)
+        self._last_write = self._io_pool.submit(self._append_log, self._diff_log, b"".join(lines))
+    
+    @staticmethod
+    def _append_log(log, payload):
+        log.write(payload)
+        log.flush()
+    
+    def replay_diff_log(self, log_file):
+        """Apply the changes recorded in a diff log; returns the last logged index"""
+        current_idx = None
+        with open(log_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = _load_json(line)
+                except ValueError:
+                    break  # A torn last line from an interrupted write
+                if "index" in record:
+                    current_idx = record["index"]
+                    continue
+                qid = record["qid"]
+                if "check" in record:
+                    if qid in self._qid_to_row:
+                        self.set_flags(qid, bytes(record["check"]))
+                    else:
+                        self._extra_checklist[qid] = dict(zip(_CRITERIA, map(bool, record["check"])))
+                if "comment" in record:
+                    self.comments[qid] = record["comment"]
+        self.rebuild_stats()
+        return current_idx
     
-    def save_progress(self, silent=False):
+    def save_progress(self, silent=False, background=False):
         if not hasattr(self, 'xml_file_path'):
             if not silent:
                 messagebox.showinfo("No File", "Please open an XML file first.")
             return
         
         # Calculate summary stats for metadata
-        total_questions = len(self.segments)
-        checked_questions = sum(1 for qid in [s["question_id"] for s in self.segments] 
-                            if qid in self.checklist and any(self.checklist[qid].values()))
+        total_questions = len(self._q_ids)
+        checked_questions = len(self._checked_qids)
         
         # Calculate counts and percentages for each checkbox
-        counts = {
-            "single_sentence": 0,
-            "multiple_sentences": 0,
-            "low_quality_distractors": 0,
-            "unsuitable_paragraph": 0,
-            "unclear_answer": 0,
-            "outside_knowledge": 0
-        }
-        for qid in [s["question_id"] for s in self.segments]:
-            if qid in self.checklist:
-                for criterion, checked in self.checklist[qid].items():
-                    if checked:
-                        counts[criterion] += 1
+        counts = dict(self._counts)
         
         progress_data = {
             "timestamp": datetime.now().isoformat(),
-            "checklist": self.checklist,
+            "checklist": self.checklist_snapshot(),
             "comments": self.comments,
             "current_index": self.current_index,
             "metadata": {
@@ -442,11 +1019,16 @@ class CompactXMLValidator:
         }
         
         try:
-            base_name = os.path.splitext(self.xml_file_path)[0]
-            progress_file = f"{base_name}_progress.json"
+            progress_file = self._progress_file
             
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, ensure_ascii=False, indent=2)
+            # Serialize on the main thread so the payload is a snapshot of the current state
+            payload = _dump_json(progress_data)
+            # The snapshot covers every logged change, so the log restarts empty
+            self._log_records = 0
+            if background:
+                self._last_write = self._io_pool.submit(self._write_snapshot, progress_file, payload, self._diff_log)
+                return self._last_write
+            self._write_snapshot(progress_file, payload, self._diff_log)
             
             if not silent:
                 messagebox.showinfo("Success", f"Progress saved to:\n{progress_file}")
@@ -456,75 +1038,112 @@ class CompactXMLValidator:
                 messagebox.showerror("Error", f"Failed to save progress: {str(e)}")
             return False
 
+    @classmethod
+    def _write_snapshot(cls, path, payload, log):
+        cls._atomic_write(path, payload)
+        if log is not None:
+            log.truncate(0)
+    
+    @staticmethod
+    def _atomic_write(path, payload):
+        """Write payload to a temporary file and move it over path"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
     def show_save_indicator(self):
-        self.save_indicator.config(text="Saving...")
-        self.root.after(1000, self.auto_save_progress)
-        self.root.after(1500, lambda: self.save_indicator.config(text="Saved"))
-        self.root.after(3000, lambda: self.save_indicator.config(text=""))
+        self._set_indicator("Saving...")
+    
+    def _set_indicator(self, text, clear_after=None):
+        """Show text in the save indicator, replacing any pending indicator timer"""
+        if self._indicator_after_id is not None:
+            self.root.after_cancel(self._indicator_after_id)
+            self._indicator_after_id = None
+        # Typing keeps re-showing "Saving..."; leave the label alone when nothing changes
+        if text != self._indicator_text:
+            self._indicator_text = text
+            self.save_indicator.config(text=text)
+        if clear_after is not None:
+            self._indicator_after_id = self.root.after(clear_after, self._set_indicator, "")
+    
+    def _watch_save(self, future):
+        """Poll a background save from the Tk thread and report its outcome"""
+        self._watched_save = future
+        if self._indicator_after_id is not None:
+            self.root.after_cancel(self._indicator_after_id)
+        self._indicator_after_id = self.root.after(50, self._poll_save)
+    
+    def _poll_save(self):
+        future = self._watched_save
+        if not future.done():
+            self._indicator_after_id = self.root.after(50, self._poll_save)
+            return
+        self._indicator_after_id = None
+        self._set_indicator("Saved" if future.exception() is None else "Save failed", 1500)
     
     def try_load_progress(self):
         if not hasattr(self, 'xml_file_path'):
             return
         
-        base_name = os.path.splitext(self.xml_file_path)[0]
-        progress_file = f"{base_name}_progress.json"
+        progress_file = self._progress_file
+        log_file = self._log_file
         
-        if not os.path.exists(progress_file):
+        if not os.path.exists(progress_file) and not os.path.exists(log_file):
             self.load_question(0)
             return
         
         try:
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = {}
+            if os.path.exists(progress_file):
+                with open(progress_file, 'rb') as f:
+                    data = _load_json(f.read())
             
             if "checklist" in data:
-                self.checklist = data["checklist"]
+                self.restore_checklist(data["checklist"])
             
             if "comments" in data:
                 self.comments = data["comments"]
             
-            if "current_index" in data:
-                current_idx = data["current_index"]
-                if 0 <= current_idx < len(self.segments):
-                    self.load_question(current_idx)
-                else:
-                    self.load_question(0)
+            current_idx = data.get("current_index", 0)
+            
+            # Changes logged after the snapshot was written, e.g. before a crash
+            replayed = os.path.exists(log_file) and os.path.getsize(log_file) > 0
+            if replayed:
+                logged_idx = self.replay_diff_log(log_file)
+                if logged_idx is not None:
+                    current_idx = logged_idx
+            
+            if 0 <= current_idx < len(self._q_ids):
+                self.load_question(current_idx)
             else:
                 self.load_question(0)
             
-            if "metadata" in data and "completion_percentage" in data["metadata"]:
+            if replayed:
+                completed = round(len(self._checked_qids) / len(self._q_ids) * 100, 1)
+                self.status_label.config(text=f"Loaded previous progress. Completion: {completed}%")
+            elif "metadata" in data and "completion_percentage" in data["metadata"]:
                 completed = data["metadata"]["completion_percentage"]
                 self.status_label.config(text=f"Loaded previous progress. Completion: {completed}%")
             else:
                 self.status_label.config(text=f"Loaded previous progress from {os.path.basename(progress_file)}")
         except Exception as e:
-            print(f"Failed to load progress: {str(e)}")
+            logger.warning("Failed to load progress: %s", e)
             self.load_question(0)
     
     def show_summary(self):
-        if not self.segments:
+        if not self._q_ids:
             messagebox.showinfo("No Data", "No questions loaded yet.")
             return
         
-        total_questions = len(self.segments)
-        checked_questions = sum(1 for qid in [s["question_id"] for s in self.segments] 
-                               if qid in self.checklist and any(self.checklist[qid].values()))
-        commented_questions = sum(1 for qid in [s["question_id"] for s in self.segments] 
-                                 if qid in self.comments and self.comments[qid])
-        
-        counts = {
-            "single_sentence": 0,
-            "multiple_sentences": 0,
-            "low_quality_distractors": 0,
-            "unsuitable_paragraph": 0,
-            "unclear_answer": 0,
-            "outside_knowledge": 0
-        }
-        for qid in [s["question_id"] for s in self.segments]:
-            if qid in self.checklist:
-                for criterion, checked in self.checklist[qid].items():
-                    if checked:
-                        counts[criterion] += 1
+        self._sync_comment()
+        total_questions = len(self._q_ids)
+        checked_questions = len(self._checked_qids)
+        # Distinct question ids, like the checked count
+        commented = {qid for qid, comment in self.comments.items() if comment}
+        commented_questions = len(commented & self._qid_set)
+        
+        counts = dict(self._counts)
         
         msg = "VALIDATION SUMMARY\n\n"
         msg += f"Total questions: {total_questions}\n"
@@ -533,23 +1152,17 @@ class CompactXMLValidator:
         msg += "Checklist percentages:\n"
         for criterion, count in counts.items():
             percentage = count / total_questions * 100 if total_questions > 0 else 0
-            label = {
-                "single_sentence": "Cần một câu",
-                "multiple_sentences": "Cần nhiều câu",
-                "low_quality_distractors": "Lựa chọn sai kém chất lượng",
-                "unsuitable_paragraph": "Đoạn văn không phù hợp",
-                "unclear_answer": "Đáp án không rõ ràng",
-                "outside_knowledge": "Cần kiến thức ngoài"
-            }[criterion]
+            label = _CRITERIA_LABELS[criterion]
             msg += f"  {label}: {count} ({percentage:.1f}%)\n"
         
         messagebox.showinfo("Summary Statistics", msg)
     
     def export_json(self):
-        if not self.segments:
+        if not self._q_ids:
             messagebox.showinfo("No Data", "No questions to export.")
             return
         
+        self._sync_comment()
         try:
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".json",
@@ -562,41 +1175,20 @@ class CompactXMLValidator:
             
             export_data = {
                 "timestamp": datetime.now().isoformat(),
-                "source_file": os.path.basename(self.xml_file_path) if hasattr(self, 'xml_file_path') else "unknown",
+                "source_file": self._xml_basename if hasattr(self, 'xml_file_path') else "unknown",
                 "checklist_summary": {},  # New section for checkbox counts and percentages
                 "questions": []
             }
             
-            total_questions = len(self.segments)
-            checked_questions = sum(1 for qid in [s["question_id"] for s in self.segments] 
-                                   if qid in self.checklist and any(self.checklist[qid].values()))
+            total_questions = len(self._q_ids)
+            checked_questions = len(self._checked_qids)
             
             # Calculate counts and percentages for each checkbox
-            counts = {
-                "single_sentence": 0,
-                "multiple_sentences": 0,
-                "low_quality_distractors": 0,
-                "unsuitable_paragraph": 0,
-                "unclear_answer": 0,
-                "outside_knowledge": 0
-            }
-            for qid in [s["question_id"] for s in self.segments]:
-                if qid in self.checklist:
-                    for criterion, checked in self.checklist[qid].items():
-                        if checked:
-                            counts[criterion] += 1
+            counts = dict(self._counts)
             
-            checklist_labels = {
-                "single_sentence": "Cần một câu",
-                "multiple_sentences": "Cần nhiều câu",
-                "low_quality_distractors": "Lựa chọn sai kém chất lượng",
-                "unsuitable_paragraph": "Đoạn văn không phù hợp",
-                "unclear_answer": "Đáp án không rõ ràng",
-                "outside_knowledge": "Cần kiến thức ngoài"
-            }
             export_data["checklist_summary"] = {
                 criterion: {
-                    "label": checklist_labels[criterion],
+                    "label": _CRITERIA_LABELS[criterion],
                     "count": count,
                     "percentage": round(count / total_questions * 100, 2) if total_questions else 0
                 }
@@ -614,33 +1206,29 @@ class CompactXMLValidator:
                 }
             }
             
-            # Populate questions data
-            for segment in self.segments:
-                question_id = segment["question_id"]
-                segment_id = segment["segment_id"]
-                
-                question_data = {
-                    "question_id": question_id,
-                    "segment_id": segment_id,
-                    "document_title": segment["document_title"],
-                    "segment_title": segment.get("segment_title", ""),
-                    "question_type": segment.get("question_type", ""),
-                    "checklist": self.checklist.get(question_id, {
-                        "single_sentence": False,
-                        "multiple_sentences": False,
-                        "low_quality_distractors": False,
-                        "unsuitable_paragraph": False,
-                        "unclear_answer": False,
-                        "outside_knowledge": False
-                    }),
-                    "comment": self.comments.get(question_id, "")
-                }
-                
-                export_data["questions"].append(question_data)
-            
-            # Write JSON file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            # Write JSON file; the questions are encoded one at a time between
+            # the head and tail of the document instead of being collected first
+            head, tail = _dump_json(export_data).split(b'"questions": []', 1)
+            columns = zip(self._q_ids, self._seg_ids, self._doc_titles, self._seg_titles, self._q_types)
+            with open(file_path, 'wb') as f:
+                f.write(head + b'"questions": [')
+                separator = b"\n"
+                for question_id, segment_id, document_title, segment_title, question_type in columns:
+                    question_data = {
+                        "question_id": question_id,
+                        "segment_id": segment_id,
+                        "document_title": document_title,
+                        "segment_title": segment_title,
+                        "question_type": question_type,
+                        "checklist": self.get_checklist(question_id),
+                        "comment": self.comments.get(question_id, "")
+                    }
+                    lines = _dump_json(question_data).split(b"\n")
+                    f.write(separator + b"\n".join(b"    " + line for line in lines))
+                    separator = b",\n"
+                if separator != b"\n":
+                    f.write(b"\n  ")
+                f.write(b"]" + tail)
             
             # Update export message to show checklist summary
             msg = f"Results exported to:\n{file_path}\n\n"
@@ -657,8 +1245,8 @@ class CompactXMLValidator:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
     def on_closing(self):
-        if hasattr(self, 'xml_file_path') and self.segments:
-            self.save_progress(silent=True)
+        self._close_progress()
+        self._io_pool.shutdown(wait=True)
         self.root.destroy()
 
 def main():